@@ -1,10 +1,20 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+import pandas as pd
 import ileum_simulator
 
 st.set_page_config(page_title="InSilicoRx", layout="wide", page_icon="🧬")
 
+
+@st.cache_data
+def dose_response_curve():
+    """
+    Dose range (mg) and Emax-model effect (%) for the reference curve
+    """
+    dose_range = np.linspace(0, 1000, 50)
+    return dose_range, (dose_range / (dose_range + 200)) * 100
+
+
 st.title("🧬 InSilicoRx: An Integrated Drug Discovery & Docking Simulator")
 st.write("College-level drug interaction & dose-response simulator")
 
@@ -34,7 +44,7 @@ interaction_score = 0
 if drug_a != drug_b:
     interaction_score += 1
 
-if "Warfarin" in [drug_a, drug_b]:
+if drug_a == "Warfarin" or drug_b == "Warfarin":
     interaction_score += 3
 
 # Patient factors
@@ -64,13 +74,11 @@ else:
 toxicity_score = (
     (dose / 1000) * 40 +
     (age / 90) * 20 +
-    (20 if kidney == "Impaired" else 0) +
-    (20 if liver == "Impaired" else 0)
+    20 * (kidney == "Impaired") +
+    20 * (liver == "Impaired") +
+    15 * (drug_a == "Warfarin" or drug_b == "Warfarin")
 )
 
-if "Warfarin" in [drug_a, drug_b]:
-    toxicity_score += 15
-
 toxicity_score = min(round(toxicity_score, 1), 100)
 
 
@@ -85,15 +93,12 @@ st.progress(toxicity_score / 100)
 
 st.header("Dose–Response Curve")
 
-dose_range = np.linspace(0, 1000, 50)
-response = (dose_range / (dose_range + 200)) * 100
-
-fig, ax = plt.subplots()
-ax.plot(dose_range, response)
-ax.set_xlabel("Dose (mg)")
-ax.set_ylabel("Effect (%)")
-ax.set_title("Dose–Response Curve")
+dose_range, response = dose_response_curve()
 
-st.pyplot(fig)
+st.line_chart(
+    pd.DataFrame({"Effect (%)": response}, index=dose_range),
+    x_label="Dose (mg)",
+    y_label="Effect (%)"
+)
 
 st.caption("⚠️ Educational use only. Not for clinical decision-making.")
@@ -235,6 +235,36 @@ def predict_docking(mw, logp, hbd, hba):
 
     return round(score + noise, 2)
     
+
+# --- FUNCTION: Venn diagram of drug vs. disease targets ---
+@st.cache_data
+def build_venn_fig(total_drug_targets, total_disease_targets, overlap_count):
+    """
+    Build the two-circle Venn figure (cached per set of target counts)
+    """
+    # Calculate Percentages
+    p1 = round((total_drug_targets / (total_drug_targets + total_disease_targets)) * 100, 1)
+    p2 = round((total_disease_targets / (total_drug_targets + total_disease_targets)) * 100, 1)
+    p_overlap = round((overlap_count / (total_drug_targets + total_disease_targets)) * 100, 1)
+
+    fig = go.Figure()
+    fig.add_shape(type="circle", x0=0, y0=0, x1=2, y1=2, line_color="black", opacity=0.7)
+    fig.add_shape(type="circle", x0=1.1, y0=0, x1=3.1, y1=2, line_color="black", opacity=0.7)
+
+    fig.add_annotation(x=0.5, y=1, text=f"{total_drug_targets}<br>({p1}%)", showarrow=False)
+    fig.add_annotation(x=1.55, y=1, text=f"<b>{overlap_count}</b><br>({p_overlap}%)", showarrow=False)
+    fig.add_annotation(x=2.6, y=1, text=f"{total_disease_targets}<br>({p2}%)", showarrow=False)
+
+    fig.update_xaxes(visible=False, range=[-0.5, 3.5])
+    fig.update_yaxes(visible=False, range=[-0.5, 2.5])
+    fig.update_layout(
+        width=600,
+        height=400,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
 # --- DYNAMIC CALCULATION ENGINE ---
 seed_string = selected_drug + selected_target + module
 seed = int(hashlib.md5(seed_string.encode()).hexdigest(), 16) % (10**6)
@@ -264,6 +294,144 @@ disease_target_db = {
     # Add more diseases here as needed
 }
 
+# --- FUNCTION: Custom compound analysis (stage 7) ---
+@st.fragment
+def custom_compound_analysis():
+    """
+    Render stage 7 as a fragment so editing the compound name
+    reruns only this block, not the whole pipeline page
+    """
+    # Re-seed so fragment reruns match a full rerun for the same selection
+    global rng
+    rng = np.random.default_rng(seed)
+
+    st.title("🧪 Custom Compound Analysis")
+
+    st.markdown("""
+Enter a compound name to analyze its potential as a drug candidate.
+The system retrieves molecular descriptors from PubChem and simulates
+docking and ADME predictions.
+""")
+
+    compound = st.text_input("Enter Compound Name")
+
+    if compound:
+
+        data = fetch_pubchem_data(compound)
+
+        if data:
+
+            # Convert to numbers to avoid TypeError
+            mw = float(data.get("MW") or 300)
+            logp = float(data.get("LogP") or 2.5)
+            hbd = float(data.get("HBD") or 2)
+            hba = float(data.get("HBA") or 5)
+
+            st.subheader("📊 Molecular Properties (from PubChem)")
+
+            col1, col2, col3, col4 = st.columns(4)
+
+            col1.metric("Molecular Weight", mw)
+            col2.metric("LogP", logp)
+            col3.metric("H-Bond Donors", hbd)
+            col4.metric("H-Bond Acceptors", hba)
+
+            st.divider()
+
+            # Docking prediction
+            affinity = predict_docking(mw, logp, hbd, hba)
+
+            st.subheader("🔗 Docking Prediction")
+
+            poses = [affinity, affinity + 0.4, affinity + 1]
+
+            pose_df = pd.DataFrame({
+                "Pose": ["Pose 1", "Pose 2", "Pose 3"],
+                "Binding Energy (kcal/mol)": poses
+            })
+
+            fig = px.bar(
+                pose_df,
+                x="Pose",
+                y="Binding Energy (kcal/mol)",
+                title="Predicted Docking Affinity"
+            )
+
+            st.plotly_chart(fig, use_container_width=True)
+
+            st.divider()
+
+            # ADME Radar
+            st.subheader("☢️ ADME Toxicity Radar")
+
+            cats = [
+                "Hepatotoxicity",
+                "Nephrotoxicity",
+                "Cardiotoxicity",
+                "Neurotoxicity",
+                "Respiratory Toxicity"
+            ]
+
+            scores = rng.uniform(20, 60, 5).round(2).tolist()
+
+            radar = go.Figure(data=go.Scatterpolar(
+                r=scores + [scores[0]],
+                theta=cats + [cats[0]],
+                fill='toself'
+            ))
+
+            radar.update_layout(
+                polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+                showlegend=False
+            )
+
+            st.plotly_chart(radar, use_container_width=True)
+
+            st.divider()
+
+            # Druglikeness evaluation
+            st.subheader("💊 Druglikeness Evaluation")
+
+            lipinski_pass = (
+                mw < 500 and
+                logp < 5 and
+                hbd <= 5 and
+                hba <= 10
+            )
+
+            score = 0
+            if mw < 500:
+                score += 1
+            if logp < 5:
+                score += 1
+            if hbd <= 5:
+                score += 1
+            if hba <= 10:
+                score += 1
+
+            st.metric("Druglikeness Score", f"{score}/4")
+
+            if lipinski_pass:
+                st.success("Passes Lipinski Rule of Five")
+            else:
+                st.warning("Possible Lipinski Rule violation")
+
+            st.divider()
+
+            # Lead candidate verdict
+            st.subheader("🧬 Lead Candidate Verdict")
+
+            if affinity < -7 and lipinski_pass:
+                st.success("Potential Lead Candidate for Drug Development")
+            elif affinity < -6:
+                st.info("Moderate Binding — Further Optimization Needed")
+            else:
+                st.warning("Weak Binding — Low Drug Potential")
+
+        else:
+            st.error("Compound not found in PubChem database.")
+
+
 # --- MODULES ---
 
 if module == "1. Virtual Screening & Herb List":
@@ -299,28 +467,8 @@ elif module == "2. Venn Diagram Analysis":
     total_disease_targets = 80 + target_seed   # e.g., 80-100
     overlap_count = 30 + (drug_seed % 25)      # e.g., 30-55
 
-    # Calculate Percentages
-    p1 = round((total_drug_targets / (total_drug_targets + total_disease_targets)) * 100, 1)
-    p2 = round((total_disease_targets / (total_drug_targets + total_disease_targets)) * 100, 1)
-    p_overlap = round((overlap_count / (total_drug_targets + total_disease_targets)) * 100, 1)
-
     # --- VENN DIAGRAM VISUAL ---
-    fig = go.Figure()
-    fig.add_shape(type="circle", x0=0, y0=0, x1=2, y1=2, line_color="black", opacity=0.7)
-    fig.add_shape(type="circle", x0=1.1, y0=0, x1=3.1, y1=2, line_color="black", opacity=0.7)
-
-    fig.add_annotation(x=0.5, y=1, text=f"{total_drug_targets}<br>({p1}%)", showarrow=False)
-    fig.add_annotation(x=1.55, y=1, text=f"<b>{overlap_count}</b><br>({p_overlap}%)", showarrow=False)
-    fig.add_annotation(x=2.6, y=1, text=f"{total_disease_targets}<br>({p2}%)", showarrow=False)
-
-    fig.update_xaxes(visible=False, range=[-0.5, 3.5])
-    fig.update_yaxes(visible=False, range=[-0.5, 2.5])
-    fig.update_layout(
-        width=600,
-        height=400,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
-    )
+    fig = build_venn_fig(total_drug_targets, total_disease_targets, overlap_count)
 
     st.plotly_chart(fig)
 
@@ -345,7 +493,7 @@ elif module == "2. Venn Diagram Analysis":
         ]
     }
 
-    st.table(pd.DataFrame(target_details))
+    st.table(target_details)
 
     st.info(
         f"**Research Summary:** For the lead compound **{selected_drug}**, "
@@ -358,8 +506,8 @@ elif module == "3. KEGG Enrichment":
     # Pathogenic pathways that vary slightly based on drug seed
     pathways = ["Pathways in cancer", "MAPK signaling", "PI3K-Akt signaling", "Autophagy", "Lipid metabolism"]
     # Generate random but consistent fold values for this specific drug
-    fold_vals = sorted([rng.uniform(18, 35) for _ in range(5)], reverse=True)
-    p_vals = sorted([rng.uniform(1.2e-7, 5.5e-5) for _ in range(5)])
+    fold_vals = sorted(rng.uniform(18, 35, 5).tolist(), reverse=True)
+    p_vals = sorted(rng.uniform(1.2e-7, 5.5e-5, 5).tolist())
 
     fig_kegg = px.bar(
         x=fold_vals, y=pathways, orientation='h', 
@@ -371,11 +519,11 @@ elif module == "3. KEGG Enrichment":
     
     
     # Data summary table
-    st.table(pd.DataFrame({
+    st.table({
         "Pathway": pathways,
         "Fold Enrichment": [round(f, 2) for f in fold_vals],
         "P-Value (FDR)": [f"{p:.2e}" for p in p_vals]
-    }))
+    })
 
 elif module == "4. GO Enrichment & STRING Network":
     st.header(f"🧬 GO Enrichment & STRING Network: {selected_drug} / {selected_target}")
@@ -387,7 +535,7 @@ elif module == "4. GO Enrichment & STRING Network":
     ]
 
     # Random fold enrichment values (dynamic per drug + target)
-    go_fold = sorted([round(rng.uniform(1.5, 6.5), 2) for _ in go_terms], reverse=True)
+    go_fold = sorted(rng.uniform(1.5, 6.5, len(go_terms)).round(2).tolist(), reverse=True)
 
     # Display GO enrichment bar chart
     fig_go = px.bar(
@@ -523,131 +671,7 @@ The residue represents the amino acid in the protein that interacts with the lig
 
 elif module == "7. Custom Compound Analysis":
 
-    st.title("🧪 Custom Compound Analysis")
-
-    st.markdown("""
-Enter a compound name to analyze its potential as a drug candidate.
-The system retrieves molecular descriptors from PubChem and simulates
-docking and ADME predictions.
-""")
-
-    compound = st.text_input("Enter Compound Name")
-
-    if compound:
-
-        data = fetch_pubchem_data(compound)
-
-        if data:
-
-            # Convert to numbers to avoid TypeError
-            mw = float(data.get("MW") or 300)
-            logp = float(data.get("LogP") or 2.5)
-            hbd = float(data.get("HBD") or 2)
-            hba = float(data.get("HBA") or 5)
-
-            st.subheader("📊 Molecular Properties (from PubChem)")
-
-            col1, col2, col3, col4 = st.columns(4)
-
-            col1.metric("Molecular Weight", mw)
-            col2.metric("LogP", logp)
-            col3.metric("H-Bond Donors", hbd)
-            col4.metric("H-Bond Acceptors", hba)
-
-            st.divider()
-
-            # Docking prediction
-            affinity = predict_docking(mw, logp, hbd, hba)
-
-            st.subheader("🔗 Docking Prediction")
-
-            poses = [affinity, affinity + 0.4, affinity + 1]
-
-            pose_df = pd.DataFrame({
-                "Pose": ["Pose 1", "Pose 2", "Pose 3"],
-                "Binding Energy (kcal/mol)": poses
-            })
-
-            fig = px.bar(
-                pose_df,
-                x="Pose",
-                y="Binding Energy (kcal/mol)",
-                title="Predicted Docking Affinity"
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-
-            st.divider()
-
-            # ADME Radar
-            st.subheader("☢️ ADME Toxicity Radar")
-
-            cats = [
-                "Hepatotoxicity",
-                "Nephrotoxicity",
-                "Cardiotoxicity",
-                "Neurotoxicity",
-                "Respiratory Toxicity"
-            ]
-
-            scores = [round(rng.uniform(20, 60), 2) for _ in range(5)]
-
-            radar = go.Figure(data=go.Scatterpolar(
-                r=scores + [scores[0]],
-                theta=cats + [cats[0]],
-                fill='toself'
-            ))
-
-            radar.update_layout(
-                polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
-                showlegend=False
-            )
-
-            st.plotly_chart(radar, use_container_width=True)
-
-            st.divider()
-
-            # Druglikeness evaluation
-            st.subheader("💊 Druglikeness Evaluation")
-
-            lipinski_pass = (
-                mw < 500 and
-                logp < 5 and
-                hbd <= 5 and
-                hba <= 10
-            )
-
-            score = 0
-            if mw < 500:
-                score += 1
-            if logp < 5:
-                score += 1
-            if hbd <= 5:
-                score += 1
-            if hba <= 10:
-                score += 1
-
-            st.metric("Druglikeness Score", f"{score}/4")
-
-            if lipinski_pass:
-                st.success("Passes Lipinski Rule of Five")
-            else:
-                st.warning("Possible Lipinski Rule violation")
-
-            st.divider()
-
-            # Lead candidate verdict
-            st.subheader("🧬 Lead Candidate Verdict")
-
-            if affinity < -7 and lipinski_pass:
-                st.success("Potential Lead Candidate for Drug Development")
-            elif affinity < -6:
-                st.info("Moderate Binding — Further Optimization Needed")
-            else:
-                st.warning("Weak Binding — Low Drug Potential")
-
-        else:
-            st.error("Compound not found in PubChem database.")
+    custom_compound_analysis()
 elif module == "9. ADME Toxicity Radar":
     st.header(f"☢️ Multi-Organ Safety Profile: {selected_drug}")
     
@@ -655,7 +679,7 @@ elif module == "9. ADME Toxicity Radar":
     cats = ['Hepatotoxicity', 'Nephrotoxicity', 'Cardiotoxicity', 'Neurotoxicity', 'Respiratory Tox']
     
     # Values change dynamically because they use the global 'rng'
-    scores = [round(rng.uniform(15, 45), 2) for _ in range(5)]
+    scores = rng.uniform(15, 45, 5).round(2).tolist()
     
     # Create the Radar
     fig = go.Figure(data=go.Scatterpolar(
@@ -679,8 +703,8 @@ elif module == "9. ADME Toxicity Radar":
     
 
     # --- THE INTERPRETATION (Unique to the drug) ---
-    avg_tox = np.mean(scores)
-    max_idx = np.argmax(scores)
+    avg_tox = sum(scores) / len(scores)
+    max_idx = scores.index(max(scores))
     max_organ = cats[max_idx]
     max_score = scores[max_idx]
 